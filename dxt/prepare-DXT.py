@@ -4,6 +4,7 @@ Prepare DXT package directory structure for mcp-simple-timeserver.
 This script creates a directory ready to be packaged by the DXT CLI tool.
 """
 
+import hashlib
 import json
 import os
 import platform
@@ -11,21 +12,135 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-import tomllib
+
+# Sidecar cache of the metadata extracted from pyproject.toml, stored next to
+# this script and keyed by a hash of pyproject.toml and of this script, so
+# changes to the extraction code also invalidate it.
+META_CACHE_FILENAME = ".meta_cache.json"
+
+# Fields read_project_metadata() returns; a cache entry missing any is a miss
+METADATA_KEYS = (
+    "name", "display_name", "version", "description", "author",
+    "dependencies", "homepage", "requires_python", "license",
+)
+
+# Host platform, looked up once ("Windows", "Darwin", "Linux", ...)
+_SYSTEM = platform.system()
+
+# Marker in the bundled venv recording which dependency set it was built from
+VENV_HASH_FILENAME = ".deps_hash"
 
 def to_display_name(name: str) -> str:
     """Converts a slug-like name to a display name.
     
     Example: "mcp-simple-timeserver" -> "MCP Simple Timeserver"
     """
-    parts = name.split('-')
-    transformed_parts = []
-    for part in parts:
-        if part.lower() == 'mcp':
-            transformed_parts.append('MCP')
+    return ' '.join(
+        'MCP' if part.lower() == 'mcp' else part.capitalize()
+        for part in name.split('-')
+    )
+
+def read_project_metadata(pyproject_path: Path, cache_path: Path) -> dict:
+    """Return the project metadata needed for the DXT manifest.
+
+    The parsed fields are cached in `cache_path` together with a hash of
+    pyproject.toml and of this script, so the TOML is only parsed again when
+    either of them changes.
+    """
+    pyproject_bytes = pyproject_path.read_bytes()
+    hasher = hashlib.blake2b(pyproject_bytes, digest_size=16)
+    hasher.update(Path(__file__).read_bytes())
+    digest = hasher.hexdigest()
+
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        metadata = cached["metadata"]
+        if cached["hash"] == digest and all(key in metadata for key in METADATA_KEYS):
+            return metadata
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or unreadable cache - parse pyproject.toml below
+
+    # Only import the TOML parser on a cache miss
+    import tomllib
+
+    project_meta = tomllib.loads(pyproject_bytes.decode("utf-8"))["project"]
+
+    license_str = "MIT" # Default
+    for classifier in project_meta.get("classifiers", []):
+        if "License :: OSI Approved" in classifier:
+            license_str = classifier.split("::")[-1].strip().replace(" License", "")
+
+    metadata = {
+        "name": project_meta["name"],
+        "display_name": to_display_name(project_meta["name"]),
+        "version": project_meta["version"],
+        "description": project_meta["description"],
+        "author": project_meta["authors"][0],
+        "dependencies": project_meta.get("dependencies", []),
+        "homepage": project_meta.get("urls", {}).get("Homepage", ""),
+        "requires_python": project_meta.get("requires-python", ">=3.11"),
+        "license": license_str,
+    }
+
+    try:
+        cache_path.write_text(
+            json.dumps({"hash": digest, "metadata": metadata}, indent=2),
+            encoding="utf-8"
+        )
+    except OSError:
+        pass  # Caching is best-effort
+
+    return metadata
+
+def build_venv(venv_dir: Path, dependencies: list[str]) -> None:
+    """Create a relocatable virtual environment with the given dependencies."""
+    # Create virtual environment
+    print(f"Creating virtual environment in {venv_dir}...")
+    subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
+    
+    # Install dependencies
+    print("Installing dependencies...")
+    if _SYSTEM == "Windows":
+        pip_path = venv_dir / "Scripts" / "pip.exe"
+        venv_python = venv_dir / "Scripts" / "python.exe"
+    else:
+        pip_path = venv_dir / "bin" / "pip"
+        venv_python = venv_dir / "bin" / "python"
+    
+    subprocess.run([
+        str(pip_path), "install", "--no-cache-dir",
+        *dependencies
+    ], check=True)
+    
+    # Drop packaging tools that are only needed at build time.
+    # This makes the package smaller, so there is less to copy and unpack on install.
+    print("Removing build-only packages from the virtual environment...")
+    subprocess.run([
+        str(venv_python), "-m", "pip", "uninstall", "-y", "pip", "setuptools"
+    ], check=True)
+    
+    # Remove home line from pyvenv.cfg to make it relocatable
+    pyvenv_cfg = venv_dir / "pyvenv.cfg"
+    if pyvenv_cfg.exists():
+        print("Making virtual environment relocatable...")
+        lines = pyvenv_cfg.read_text().splitlines()
+        # Keep all lines except the home line - let launcher set it
+        filtered_lines = [line for line in lines if not line.startswith("home = ")]
+        # Add a placeholder that the launcher will replace
+        filtered_lines.insert(0, "home = WILL_BE_SET_BY_LAUNCHER")
+        pyvenv_cfg.write_text("\n".join(filtered_lines) + "\n")
+
+def clean_build_dir(build_dir: Path, keep: Path) -> None:
+    """Remove everything in build_dir except the `keep` path and its parents."""
+    for path in build_dir.iterdir():
+        if path == keep:
+            continue
+        if path.is_dir() and keep.is_relative_to(path):
+            clean_build_dir(path, keep)
+        elif path.is_dir():
+            shutil.rmtree(path)
         else:
-            transformed_parts.append(part.capitalize())
-    return ' '.join(transformed_parts)
+            path.unlink()
 
 def prepare_dxt_package():
     """Prepare the DXT package directory structure."""
@@ -36,38 +151,45 @@ def prepare_dxt_package():
     server_dir = build_dir / "server"
     venv_dir = server_dir / "venv"
 
-    # Read metadata from pyproject.toml
+    # Read metadata from pyproject.toml (or the cached copy of it)
     print("Reading metadata from pyproject.toml...")
     pyproject_path = root_dir / "pyproject.toml"
     try:
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomllib.load(f)
-        
-        project_meta = pyproject_data["project"]
-        project_name = project_meta["name"]
-        project_version = project_meta["version"]
-        project_description = project_meta["description"]
-        author_info = project_meta["authors"][0]
-        dependencies = project_meta.get("dependencies", [])
-        homepage_url = project_meta.get("urls", {}).get("Homepage", "")
-        python_version_req = project_meta.get("requires-python", ">=3.11")
-        
-        license_str = "MIT" # Default
-        for classifier in project_meta.get("classifiers", []):
-            if "License :: OSI Approved" in classifier:
-                license_str = classifier.split("::")[-1].strip().replace(" License", "")
-
+        project_meta = read_project_metadata(
+            pyproject_path, script_dir / META_CACHE_FILENAME
+        )
     except (FileNotFoundError, KeyError, IndexError) as e:
         print(f"Error: Could not read {pyproject_path} or it is malformed. {e}")
         sys.exit(1)
-    
-    # Generate display name
-    display_name = to_display_name(project_name)
+
+    project_name = project_meta["name"]
+    project_version = project_meta["version"]
+    project_description = project_meta["description"]
+    author_info = project_meta["author"]
+    dependencies = project_meta["dependencies"]
+    homepage_url = project_meta["homepage"]
+    python_version_req = project_meta["requires_python"]
+    license_str = project_meta["license"]
+    display_name = project_meta["display_name"]
+
+    # The virtual environment only depends on the dependency list and the
+    # Python version, so it can be kept from a previous build when neither changed
+    venv_digest = hashlib.blake2b(
+        json.dumps([sys.version, dependencies]).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    venv_hash_path = venv_dir / VENV_HASH_FILENAME
+    reuse_venv = (
+        venv_hash_path.exists()
+        and venv_hash_path.read_text(encoding="utf-8").strip() == venv_digest
+    )
 
     # Clean previous build
     if build_dir.exists():
         print(f"Cleaning previous build directory: {build_dir}")
-        shutil.rmtree(build_dir)
+        if reuse_venv:
+            clean_build_dir(build_dir, keep=venv_dir)
+        else:
+            shutil.rmtree(build_dir)
     
     # Create directory structure
     print("Creating DXT directory structure...")
@@ -86,45 +208,29 @@ def prepare_dxt_package():
     shutil.copy2(script_dir / "launcher.bat", build_dir / "launcher.bat")
     shutil.copy2(script_dir / "launcher.sh", build_dir / "launcher.sh")
     
-    # Copy icon if it exists
+    # Copy icon if it exists (a hard link is enough, the icon is never modified)
     icon_path = script_dir / "icon.png"
     if icon_path.exists():
-        shutil.copy2(icon_path, build_dir / "icon.png")
+        try:
+            os.link(icon_path, build_dir / "icon.png")
+        except OSError:
+            # Different filesystem or no hard link support
+            shutil.copy2(icon_path, build_dir / "icon.png")
     
     # Make launcher.sh executable
     launcher_sh = build_dir / "launcher.sh"
     launcher_sh.chmod(launcher_sh.stat().st_mode | 0o755)
     
-    # Create virtual environment
-    print(f"Creating virtual environment in {venv_dir}...")
-    subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
-    
-    # Install dependencies
-    print("Installing dependencies...")
-    if platform.system() == "Windows":
-        pip_path = venv_dir / "Scripts" / "pip.exe"
+    if reuse_venv:
+        print(f"Dependencies unchanged, reusing virtual environment in {venv_dir}")
+        # Never ship a launcher marker left over from a local test run
+        (venv_dir / ".configured").unlink(missing_ok=True)
     else:
-        pip_path = venv_dir / "bin" / "pip"
-    
-    subprocess.run([
-        str(pip_path), "install", "--no-cache-dir",
-        *dependencies
-    ], check=True)
-    
-    # Remove home line from pyvenv.cfg to make it relocatable
-    pyvenv_cfg = venv_dir / "pyvenv.cfg"
-    if pyvenv_cfg.exists():
-        print("Making virtual environment relocatable...")
-        lines = pyvenv_cfg.read_text().splitlines()
-        # Keep all lines except the home line - let launcher set it
-        filtered_lines = [line for line in lines if not line.startswith("home = ")]
-        # Add a placeholder that the launcher will replace
-        filtered_lines.insert(0, "home = WILL_BE_SET_BY_LAUNCHER")
-        pyvenv_cfg.write_text("\n".join(filtered_lines) + "\n")
+        build_venv(venv_dir, dependencies)
+        venv_hash_path.write_text(venv_digest, encoding="utf-8")
     
     # Determine platform-specific command
-    system = platform.system()
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         entry_point = "launcher.bat"
         mcp_command = "cmd.exe"
         mcp_args = ["/c", "${__dirname}\\launcher.bat"]
@@ -187,15 +293,14 @@ def prepare_dxt_package():
         manifest["icon"] = "icon.png"
     
     manifest_path = build_dir / "manifest.json"
-    print(f"Creating manifest.json for {system}...")
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    print(f"Creating manifest.json for {_SYSTEM}...")
+    manifest_path.write_bytes(json.dumps(manifest, indent=2).encode("utf-8"))
     
     print(f"\nDXT package prepared in: {build_dir}")
-    print(f"Platform: {system}")
+    print(f"Platform: {_SYSTEM}")
     print(f"Command: {mcp_command} {' '.join(mcp_args)}")
     print("\nTo create the DXT package, run:")
-    print(f"  npx @anthropic-ai/dxt pack ./dxt_build mcp-simple-timeserver-{system.lower()}.dxt")
+    print(f"  npx @anthropic-ai/dxt pack ./dxt_build mcp-simple-timeserver-{_SYSTEM.lower()}.dxt")
     
     # Write version to a file for the CI workflow to use
     (build_dir / "version.txt").write_text(project_version)
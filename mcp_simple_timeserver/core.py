@@ -4,31 +4,83 @@ Core functionality shared between local and web MCP timeserver variants.
 This module contains:
 - NTP time fetching
 - Timezone/location resolution (geocoding)
-- Calendar formatting functions
 - Shared tool implementation logic
+
+Calendar formatting functions live in core_calendars and are only imported
+when a calendar conversion is requested.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta, UTC
+from functools import lru_cache
 from importlib.metadata import version as get_version
 from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import asyncio
 import re
+import socket
+import struct
+import time
 
-import ntplib
 import pycountry
 import requests
-from hijridate import Gregorian
-from japanera import EraDateTime
-from pyluach import dates as hebrew_dates
-from persiantools.jdatetime import JalaliDateTime
-from timezonefinder import TimezoneFinder
+from tzfpy import get_tz
 
 
 # Default NTP server
 DEFAULT_NTP_SERVER = 'pool.ntp.org'
 
+# Cache of successful NTP responses, keyed by server.
+# Values: (monotonic timestamp of the query, UTC datetime returned by the server)
+# Calls within the TTL reuse the last response, advanced by the elapsed
+# monotonic time, instead of doing another network round-trip. The local
+# monotonic clock drifts far less than a second per minute, and the TTL keeps
+# repeat calls from hitting the pool.ntp.org rate limits.
+_ntp_cache: dict[str, tuple[float, datetime]] = {}
+NTP_CACHE_TTL = 60  # seconds
+
+# Worker threads for running the NTP query alongside location resolution.
+# Threads are only started on first use.
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="timeserver-io")
+
+# Resolved NTP server addresses, keyed by server name.
+# Values: (monotonic timestamp of the lookup, address family, socket address)
+# from getaddrinfo. An entry is used for NTP_ADDRESS_CACHE_TTL and dropped
+# early when a query to it fails, so a long-running server keeps following
+# the pool's DNS rotation instead of sticking to one member.
+_ntp_address_cache: dict[str, tuple[float, int, tuple]] = {}
+NTP_ADDRESS_CACHE_TTL = 300  # seconds
+
+# SNTP wire format (RFC 4330)
+NTP_PORT = 123
+NTP_TIMEOUT = 5  # seconds
+# 48-byte client request: LI=0, VN=3, Mode=3 (client), all other fields zero
+_NTP_REQUEST_PACKET = b'\x1b' + 47 * b'\0'
+# Seconds between the NTP epoch (1900-01-01) and the Unix epoch (1970-01-01)
+_NTP_EPOCH_OFFSET = 2208988800
+
+# UTC offset timezone format: +HH:MM, -HH:MM, +HHMM, -HHMM
+_OFFSET_RE = re.compile(r'^([+-])(\d{2}):?(\d{2})$')
+
+# IANA timezone names without a "/" (legacy aliases and UTC synonyms), stored
+# uppercase for a case-insensitive check. Any other name without a "/" cannot
+# be a valid timezone, so parse_timezone_param skips the tzdata lookup for it.
+_IANA_BARE_NAMES = frozenset({
+    "CET", "CST6CDT", "CUBA", "EET", "EGYPT", "EIRE", "EST", "EST5EDT",
+    "FACTORY", "GB", "GB-EIRE", "GMT", "GMT+0", "GMT-0", "GMT0", "GREENWICH",
+    "HONGKONG", "HST", "ICELAND", "IRAN", "ISRAEL", "JAMAICA", "JAPAN",
+    "KWAJALEIN", "LIBYA", "LOCALTIME", "MET", "MST", "MST7MDT", "NAVAJO", "NZ",
+    "NZ-CHAT", "POLAND", "PORTUGAL", "POSIXRULES", "PRC", "PST8PDT", "ROC",
+    "ROK", "SINGAPORE", "TURKEY", "UCT", "UNIVERSAL", "UTC", "W-SU", "WET",
+    "ZULU",
+})
+
 # Nominatim API configuration (OpenStreetMap geocoding service)
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 NOMINATIM_TIMEOUT = 5  # seconds
+GEOCODE_CACHE_SIZE = 1024  # distinct location queries kept in memory
+TIMEZONE_CACHE_SIZE = 2048  # distinct ~1 km coordinate cells kept in memory
+ZONEINFO_CACHE_SIZE = 256  # ZoneInfo objects kept strongly referenced
+CALENDAR_PARSE_CACHE_SIZE = 128  # distinct calendar parameter strings
 
 # Holiday API configuration
 NAGER_API_URL = "https://date.nager.at/api/v3"
@@ -96,7 +148,7 @@ def fetch_public_holidays_nager(country_code: str, year: int) -> list[dict]:
         return cached
 
     url = f"{NAGER_API_URL}/PublicHolidays/{year}/{country_code}"
-    headers = {"User-Agent": _get_user_agent()}
+    headers = {"User-Agent": _USER_AGENT}
 
     try:
         response = requests.get(url, headers=headers, timeout=NAGER_TIMEOUT)
@@ -143,7 +195,7 @@ def fetch_subdivisions_openholidays(country_code: str) -> dict[str, str]:
 
     url = f"{OPENHOLIDAYS_API_URL}/Subdivisions"
     params = {"countryIsoCode": country_code}
-    headers = {"User-Agent": _get_user_agent()}
+    headers = {"User-Agent": _USER_AGENT}
 
     try:
         response = requests.get(
@@ -217,7 +269,7 @@ def fetch_school_holidays_openholidays(
         "validFrom": f"{year}-01-01",
         "validTo": f"{year}-12-31",
     }
-    headers = {"User-Agent": _get_user_agent()}
+    headers = {"User-Agent": _USER_AGENT}
 
     try:
         response = requests.get(
@@ -292,7 +344,7 @@ def fetch_public_holidays_openholidays(
         "validFrom": f"{year}-01-01",
         "validTo": f"{year}-12-31",
     }
-    headers = {"User-Agent": _get_user_agent()}
+    headers = {"User-Agent": _USER_AGENT}
 
     try:
         response = requests.get(
@@ -435,41 +487,61 @@ def resolve_country_code(country: str) -> Optional[str]:
     return None
 
 
-def _get_user_agent() -> str:
+@lru_cache(maxsize=None)
+def get_package_version() -> str:
     """
-    Get User-Agent string with current package version.
+    Get the installed package version (cached).
 
     Uses importlib.metadata to read version from installed package,
-    ensuring we have a single source of truth (pyproject.toml).
+    ensuring we have a single source of truth (pyproject.toml). The lookup
+    reads package metadata from disk, so it is done once per process and
+    shared by the User-Agent header and the server apps.
+
+    :return: Package version string, or "unknown" if not installed.
     """
     try:
-        pkg_version = get_version("mcp-simple-timeserver")
+        return get_version("mcp-simple-timeserver")
     except Exception:
-        pkg_version = "unknown"
-    return f"mcp-simple-timeserver/{pkg_version}"
+        return "unknown"
+
+
+def _get_user_agent() -> str:
+    """
+    Get User-Agent string with current package version.
+    """
+    return f"mcp-simple-timeserver/{get_package_version()}"
 
 
-# Lazy-loaded TimezoneFinder instance
-# Note on timezonefinder data model:
-# - Shape data (~40MB) is BUNDLED with the pip package (no runtime download)
-# - Data is stored in site-packages/timezonefinder/
-# - On first use, data is loaded into RAM (not fetched from network)
-# - Web server: long-lived process, init once, reuse across all requests (fast)
-# - Local stdio: new process per session, ~1-2s init cost on first location call
-_timezone_finder: Optional[TimezoneFinder] = None
+# Resolved once at import and reused by every outgoing HTTP request
+_USER_AGENT = _get_user_agent()
 
 
-def _get_timezone_finder() -> TimezoneFinder:
+# Shared HTTP session for Nominatim requests.
+# Keeps the TCP/TLS connection to nominatim.openstreetmap.org alive between
+# lookups instead of reconnecting on every call. Only used for simple GETs,
+# which is safe to do from multiple threads.
+_nominatim_session = requests.Session()
+_nominatim_session.headers.update({"User-Agent": _USER_AGENT})
+
+
+# Note on the tzfpy data model:
+# - Simplified timezone polygons (Rust tzf-rs) are BUNDLED with the wheel
+#   (no runtime download)
+# - Importing tzfpy is cheap; the polygon index is loaded into RAM on the
+#   first lookup (~0.1s), then reused for the life of the process
+# - Boundaries are simplified, so points within a few km of a timezone border
+#   may resolve to the neighbouring zone; this does not matter for city lookups
+
+
+def warmup() -> None:
     """
-    Get or create the TimezoneFinder instance (lazy initialization).
+    Load expensive lazily initialized resources up front.
 
-    TimezoneFinder loads shape data into memory on first instantiation.
-    We use a singleton pattern to avoid repeated loading within a process.
+    Intended for the long-lived web server, so that the first location query
+    does not pay the timezone data loading cost. The short-lived stdio
+    variant keeps the lazy behavior.
     """
-    global _timezone_finder
-    if _timezone_finder is None:
-        _timezone_finder = TimezoneFinder()
-    return _timezone_finder
+    get_tz(0.0, 0.0)
 
 
 # Geocoding and timezone resolution functions
@@ -478,10 +550,30 @@ def geocode_location(query: str) -> Optional[tuple[float, float, str]]:
     """
     Resolve a location name (city/country) to coordinates using Nominatim.
 
+    Results (including "not found") are cached in memory per normalized query,
+    so repeated lookups of the same place do not hit the network again.
+
     :param query: Location name (e.g., "Warsaw", "Poland", "New York, USA")
     :return: Tuple of (latitude, longitude, display_name) or None if not found.
     """
-    headers = {"User-Agent": _get_user_agent()}
+    try:
+        return _geocode_location_cached(query.strip().lower())
+    except (requests.RequestException, ValueError, KeyError):
+        # Network errors, timeouts, invalid JSON, or missing fields
+        return None
+
+
+@lru_cache(maxsize=GEOCODE_CACHE_SIZE)
+def _geocode_location_cached(query: str) -> Optional[tuple[float, float, str]]:
+    """
+    Query Nominatim for a normalized location name (cached).
+
+    Errors are raised rather than returned as None, so that a failed
+    request is not stored in the cache.
+
+    :param query: Normalized (stripped, lowercased) location name.
+    :return: Tuple of (latitude, longitude, display_name) or None if not found.
+    """
     params = {
         "q": query,
         "format": "json",
@@ -489,30 +581,24 @@ def geocode_location(query: str) -> Optional[tuple[float, float, str]]:
         "addressdetails": 1,  # Get structured address for display name
     }
 
-    try:
-        response = requests.get(
-            NOMINATIM_URL,
-            params=params,
-            headers=headers,
-            timeout=NOMINATIM_TIMEOUT
-        )
-        response.raise_for_status()
-        results = response.json()
-
-        if results:
-            result = results[0]
-            lat = float(result["lat"])
-            lon = float(result["lon"])
-            display_name = result.get("display_name", query)
-            # Simplify display name: take first two parts (typically city, country)
-            parts = display_name.split(", ")
-            if len(parts) > 2:
-                display_name = f"{parts[0]}, {parts[-1]}"
-            return (lat, lon, display_name)
-
-    except (requests.RequestException, ValueError, KeyError):
-        # Network errors, timeouts, invalid JSON, or missing fields
-        pass
+    response = _nominatim_session.get(
+        NOMINATIM_URL,
+        params=params,
+        timeout=NOMINATIM_TIMEOUT
+    )
+    response.raise_for_status()
+    results = response.json()
+
+    if results:
+        result = results[0]
+        lat = float(result["lat"])
+        lon = float(result["lon"])
+        display_name = result.get("display_name", query)
+        # Simplify display name: take first two parts (typically city, country)
+        parts = display_name.split(", ")
+        if len(parts) > 2:
+            display_name = f"{parts[0]}, {parts[-1]}"
+        return (lat, lon, display_name)
 
     return None
 
@@ -532,7 +618,6 @@ def geocode_location_detailed(
              subdivision_name: State/region/voivodeship name (e.g., "Mazowieckie", "Bayern")
              display_name: Human-readable location name for display
     """
-    headers = {"User-Agent": _get_user_agent()}
     params = {
         "q": query,
         "format": "json",
@@ -541,10 +626,9 @@ def geocode_location_detailed(
     }
 
     try:
-        response = requests.get(
+        response = _nominatim_session.get(
             NOMINATIM_URL,
             params=params,
-            headers=headers,
             timeout=NOMINATIM_TIMEOUT
         )
         response.raise_for_status()
@@ -620,19 +704,50 @@ def find_subdivision_code(
 
 def coords_to_timezone(lat: float, lon: float) -> Optional[str]:
     """
-    Convert coordinates to IANA timezone name using timezonefinder.
+    Convert coordinates to IANA timezone name using tzfpy.
+
+    Coordinates are rounded to 2 decimal places (~1 km) before the lookup,
+    so repeated queries for the same area are served from an in-memory cache.
 
     :param lat: Latitude in degrees.
     :param lon: Longitude in degrees.
     :return: IANA timezone name (e.g., "Europe/Warsaw") or None if not found.
     """
-    tf = _get_timezone_finder()
+    return _coords_to_timezone_cached(round(lat, 2), round(lon, 2))
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def _coords_to_timezone_cached(lat: float, lon: float) -> Optional[str]:
+    """
+    Look up the timezone for already rounded coordinates (cached).
+
+    :param lat: Latitude in degrees, rounded.
+    :param lon: Longitude in degrees, rounded.
+    :return: IANA timezone name or None if not found.
+    """
     try:
-        return tf.timezone_at(lat=lat, lng=lon)
+        # Note: tzfpy takes (longitude, latitude) and returns "" when not found
+        return get_tz(lon, lat) or None
     except Exception:
         return None
 
 
+@lru_cache(maxsize=ZONEINFO_CACHE_SIZE)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """
+    Get a ZoneInfo object for an IANA timezone name (cached).
+
+    Keeps recently used timezones strongly referenced, so they are not
+    evicted from ZoneInfo's own weak cache and parsed again from tzdata.
+    Lookup failures raise as usual and are not cached.
+
+    :param name: IANA timezone name (e.g., "Europe/Warsaw").
+    :return: ZoneInfo object.
+    :raises ZoneInfoNotFoundError: If the timezone does not exist.
+    """
+    return ZoneInfo(name)
+
+
 def parse_timezone_param(tz_str: str) -> Optional[ZoneInfo]:
     """
     Parse a timezone parameter string into a ZoneInfo object.
@@ -648,15 +763,19 @@ def parse_timezone_param(tz_str: str) -> Optional[ZoneInfo]:
     if not tz_str:
         return None
 
-    # Try IANA timezone name first
-    try:
-        return ZoneInfo(tz_str)
-    except (ZoneInfoNotFoundError, KeyError):
-        pass
+    # Try IANA timezone name first. IANA names never start with a sign and
+    # contain a "/" unless they are one of the few bare names, so offset
+    # strings and other garbage skip the lookup (and the exception it raises).
+    if tz_str[0] not in "+-" and (
+        "/" in tz_str or tz_str.upper() in _IANA_BARE_NAMES
+    ):
+        try:
+            return _zoneinfo(tz_str)
+        except (ZoneInfoNotFoundError, KeyError):
+            pass
 
     # Try UTC offset format: +HH:MM, -HH:MM, +HHMM, -HHMM
-    offset_pattern = r'^([+-])(\d{2}):?(\d{2})$'
-    match = re.match(offset_pattern, tz_str)
+    match = _OFFSET_RE.match(tz_str)
     if match:
         sign = 1 if match.group(1) == '+' else -1
         hours = int(match.group(2))
@@ -667,6 +786,25 @@ def parse_timezone_param(tz_str: str) -> Optional[ZoneInfo]:
     return None
 
 
+def _geocode_to_timezone(query: str) -> Optional[tuple[ZoneInfo, str]]:
+    """
+    Resolve a location name to its timezone via geocoding.
+
+    :param query: Location name (city or country).
+    :return: Tuple of (timezone_object, display_name) or None if not resolved.
+    """
+    geo_result = geocode_location(query)
+    if geo_result:
+        lat, lon, display_name = geo_result
+        tz_name = coords_to_timezone(lat, lon)
+        if tz_name:
+            try:
+                return (_zoneinfo(tz_name), display_name)
+            except (ZoneInfoNotFoundError, KeyError):
+                pass
+    return None
+
+
 def resolve_location(
     tz: str = "",
     country: str = "",
@@ -704,16 +842,10 @@ def resolve_location(
 
     # Priority 2: City parameter
     if city.strip():
-        geo_result = geocode_location(city.strip())
+        geo_result = _geocode_to_timezone(city.strip())
         if geo_result:
-            lat, lon, display_name = geo_result
-            tz_name = coords_to_timezone(lat, lon)
-            if tz_name:
-                try:
-                    tz_obj = ZoneInfo(tz_name)
-                    return (tz_obj, display_name, None)
-                except (ZoneInfoNotFoundError, KeyError):
-                    pass
+            tz_obj, display_name = geo_result
+            return (tz_obj, display_name, None)
         return (
             None,
             "",
@@ -724,16 +856,10 @@ def resolve_location(
 
     # Priority 3: Country parameter
     if country.strip():
-        geo_result = geocode_location(country.strip())
+        geo_result = _geocode_to_timezone(country.strip())
         if geo_result:
-            lat, lon, display_name = geo_result
-            tz_name = coords_to_timezone(lat, lon)
-            if tz_name:
-                try:
-                    tz_obj = ZoneInfo(tz_name)
-                    return (tz_obj, display_name, None)
-                except (ZoneInfoNotFoundError, KeyError):
-                    pass
+            tz_obj, display_name = geo_result
+            return (tz_obj, display_name, None)
         return (
             None,
             "",
@@ -745,117 +871,193 @@ def resolve_location(
     return (None, "", None)
 
 
+def _get_cached_ntp_time(server: str) -> Optional[datetime]:
+    """
+    Get the current time from a recent cached NTP response, if there is one.
+
+    :param server: NTP server address.
+    :return: Cached server time advanced by the elapsed time, or None if
+             there is no response younger than NTP_CACHE_TTL.
+    """
+    cached = _ntp_cache.get(server)
+    if cached is not None:
+        cached_at, cached_time = cached
+        elapsed = time.monotonic() - cached_at
+        if elapsed < NTP_CACHE_TTL:
+            return cached_time + timedelta(seconds=elapsed)
+    return None
+
+
+def _get_cached_ntp_address(server: str) -> Optional[tuple[int, tuple]]:
+    """
+    Get a recently resolved address of an NTP server, if there is one.
+
+    :param server: NTP server address.
+    :return: (address family, socket address), or None if the server was not
+             resolved within NTP_ADDRESS_CACHE_TTL.
+    """
+    cached = _ntp_address_cache.get(server)
+    if cached is not None:
+        resolved_at, family, address = cached
+        if time.monotonic() - resolved_at < NTP_ADDRESS_CACHE_TTL:
+            return family, address
+    return None
+
+
+def _parse_ntp_response(data: bytes) -> datetime:
+    """
+    Extract the transmit timestamp from an SNTP response packet.
+
+    :param data: Raw response packet (at least 48 bytes).
+    :return: Server transmit time as a UTC datetime.
+    :raises ValueError: If the packet is too short.
+    """
+    if len(data) < 48:
+        raise ValueError(f"NTP response too short ({len(data)} bytes)")
+    seconds, fraction = struct.unpack("!II", data[40:48])
+    tx_time = seconds - _NTP_EPOCH_OFFSET + fraction / 2**32
+    return datetime.fromtimestamp(tx_time, tz=UTC)
+
+
 def get_ntp_datetime(server: str = DEFAULT_NTP_SERVER) -> tuple[datetime, bool]:
     """
     Fetches accurate UTC time from an NTP server.
 
+    A successful response is reused for up to NTP_CACHE_TTL (60) seconds,
+    advanced by the local monotonic clock, so the returned time is at most
+    that old relative to the last real NTP exchange.
+
     :param server: NTP server address to query.
     :return: A tuple of (datetime, is_ntp_time). If NTP fails, falls back to
              local time with is_ntp_time=False.
     """
+    cached_time = _get_cached_ntp_time(server)
+    if cached_time is not None:
+        return cached_time, True
+
     try:
-        ntp_client = ntplib.NTPClient()
-        response = ntp_client.request(server, version=3)
-        return datetime.fromtimestamp(response.tx_time, tz=UTC), True
-    except (ntplib.NTPException, OSError):
-        # Catches NTP errors, socket timeouts, and network errors
+        cached_address = _get_cached_ntp_address(server)
+        if cached_address is None:
+            addr_info = socket.getaddrinfo(server, NTP_PORT, type=socket.SOCK_DGRAM)
+            family, _, _, _, address = addr_info[0]
+            _ntp_address_cache[server] = (time.monotonic(), family, address)
+        else:
+            family, address = cached_address
+        with socket.socket(family, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(NTP_TIMEOUT)
+            # A connected UDP socket only receives replies from the server
+            sock.connect(address)
+            sock.send(_NTP_REQUEST_PACKET)
+            data = sock.recv(1024)
+        ntp_time = _parse_ntp_response(data)
+    except (OSError, ValueError):
+        # Catches DNS failures, socket timeouts, network errors and bad packets
+        _ntp_address_cache.pop(server, None)
         return datetime.now(tz=UTC), False
 
+    _ntp_cache[server] = (time.monotonic(), ntp_time)
+    return ntp_time, True
 
-# Calendar formatting functions
 
-def format_unix(ntp_time: datetime) -> str:
-    """Format time as Unix timestamp."""
-    timestamp = int(ntp_time.timestamp())
-    return f"--- Unix Timestamp ---\n{timestamp}"
+async def get_ntp_datetime_async(
+    server: str = DEFAULT_NTP_SERVER
+) -> tuple[datetime, bool]:
+    """
+    Fetches accurate UTC time from an NTP server without blocking the event loop.
 
+    Async counterpart of get_ntp_datetime() for the web variant. The SNTP
+    exchange is done on a non-blocking UDP socket, so concurrent requests
+    wait on the network instead of occupying a worker thread each.
+    Shares the response cache with get_ntp_datetime().
 
-def format_isodate(ntp_time: datetime) -> str:
-    """Format time as ISO 8601 week date."""
-    iso_week_date = ntp_time.strftime("%G-W%V-%u")
-    return f"--- ISO Week Date ---\n{iso_week_date}"
+    :param server: NTP server address to query.
+    :return: A tuple of (datetime, is_ntp_time). If NTP fails, falls back to
+             local time with is_ntp_time=False.
+    """
+    cached_time = _get_cached_ntp_time(server)
+    if cached_time is not None:
+        return cached_time, True
 
+    loop = asyncio.get_running_loop()
+    try:
+        async with asyncio.timeout(NTP_TIMEOUT):
+            cached_address = _get_cached_ntp_address(server)
+            if cached_address is None:
+                addr_info = await loop.getaddrinfo(
+                    server, NTP_PORT, type=socket.SOCK_DGRAM
+                )
+                family, _, _, _, address = addr_info[0]
+                _ntp_address_cache[server] = (time.monotonic(), family, address)
+            else:
+                family, address = cached_address
+            with socket.socket(family, socket.SOCK_DGRAM) as sock:
+                sock.setblocking(False)
+                # A connected UDP socket only receives replies from the server
+                await loop.sock_connect(sock, address)
+                await loop.sock_sendall(sock, _NTP_REQUEST_PACKET)
+                data = await loop.sock_recv(sock, 1024)
+        ntp_time = _parse_ntp_response(data)
+    except (OSError, TimeoutError, ValueError):
+        # Catches DNS failures, socket timeouts, network errors and bad packets
+        _ntp_address_cache.pop(server, None)
+        return datetime.now(tz=UTC), False
 
-def calendar_hijri(ntp_time: datetime) -> str:
-    """Format time in Hijri (Islamic) calendar."""
-    hijri = Gregorian.fromdate(ntp_time.date()).to_hijri()
-    hijri_formatted = hijri.isoformat()
-    month_name = hijri.month_name()
-    day_name = hijri.day_name()
-    notation = hijri.notation()
-    return (
-        f"--- Hijri Calendar ---\n"
-        f"Date: {hijri_formatted} {notation}\n"
-        f"Month: {month_name}\n"
-        f"Day: {day_name}"
-    )
+    _ntp_cache[server] = (time.monotonic(), ntp_time)
+    return ntp_time, True
 
 
-def calendar_japanese(ntp_time: datetime) -> str:
-    """Format time in Japanese Era calendar (both English and Kanji)."""
-    era_datetime = EraDateTime.from_datetime(ntp_time)
-    # English format: Reiwa 7, January 15, 14:00
-    english_formatted = era_datetime.strftime("%-E %-Y, %B %d, %H:%M")
-    # Kanji format: 令和7年01月15日 14時
-    kanji_formatted = era_datetime.strftime("%-K%-y年%m月%d日 %H時")
-    era_english = era_datetime.era.english
-    era_kanji = era_datetime.era.kanji
-    return (
-        f"--- Japanese Calendar ---\n"
-        f"English: {english_formatted}\n"
-        f"Kanji: {kanji_formatted}\n"
-        f"Era: {era_english} ({era_kanji})"
-    )
+# Shared tool implementation functions
+
+# English weekday names indexed by datetime.weekday(), used instead of
+# strftime("%A") so that formatting does not go through the C library
+_WEEKDAYS = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
 
 
-def calendar_persian(ntp_time: datetime) -> str:
-    """Format time in Persian (Jalali) calendar (both English and Farsi)."""
-    jalali_dt = JalaliDateTime(ntp_time)
-    english_formatted = jalali_dt.strftime("%A %d %B %Y", locale="en")
-    farsi_formatted = jalali_dt.strftime("%A %d %B %Y", locale="fa")
+def _format_datetime(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM:SS."""
     return (
-        f"--- Persian Calendar ---\n"
-        f"English: {english_formatted}\n"
-        f"Farsi: {farsi_formatted}"
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
     )
 
 
-def calendar_hebrew(ntp_time: datetime) -> str:
-    """Format time in Hebrew (Jewish) calendar (both English and Hebrew)."""
-    gregorian_date = hebrew_dates.GregorianDate(
-        ntp_time.year, ntp_time.month, ntp_time.day
-    )
-    hebrew_date = gregorian_date.to_heb()
-    english_formatted = f"{hebrew_date.day} {hebrew_date.month_name()} {hebrew_date.year}"
-    hebrew_formatted = hebrew_date.hebrew_date_string()
+# Cached name of the machine's local timezone: (monotonic time it was read, name)
+# The name changes with DST (e.g. CET/CEST), so it is re-read after the TTL.
+_local_tz_cache: Optional[tuple[float, str]] = None
+LOCAL_TZ_CACHE_TTL = 60  # seconds
 
-    # Check for holiday in both languages
-    holiday_en = hebrew_date.holiday(hebrew=False)
-    holiday_he = hebrew_date.holiday(hebrew=True)
-    holiday_line = ""
-    if holiday_en:
-        holiday_line = f"\nHoliday: {holiday_en} ({holiday_he})"
 
-    return (
-        f"--- Hebrew Calendar ---\n"
-        f"English: {english_formatted}\n"
-        f"Hebrew: {hebrew_formatted}"
-        f"{holiday_line}"
-    )
+def _get_local_tz_name(local_time: datetime) -> str:
+    """
+    Get the name of the local timezone, re-reading it at most once per TTL.
 
+    :param local_time: Current naive local time, used when refreshing.
+    :return: Local timezone name (e.g., "CET").
+    """
+    global _local_tz_cache
+    now = time.monotonic()
+    if _local_tz_cache is not None and now - _local_tz_cache[0] < LOCAL_TZ_CACHE_TTL:
+        return _local_tz_cache[1]
+    tz_name = str(local_time.astimezone().tzinfo)
+    _local_tz_cache = (now, tz_name)
+    return tz_name
 
-# Mapping of calendar names to their formatting functions
-CALENDAR_FORMATTERS = {
-    "unix": format_unix,
-    "isodate": format_isodate,
-    "hijri": calendar_hijri,
-    "japanese": calendar_japanese,
-    "persian": calendar_persian,
-    "hebrew": calendar_hebrew,
-}
 
+def local_time_result(label: str) -> str:
+    """
+    Generate the result string for the local/server time tools.
+
+    :param label: Leading label for the time line (e.g., "Current Time").
+    :return: Formatted local time string with day and timezone.
+    """
+    local_time = datetime.now()
+    timezone_name = _get_local_tz_name(local_time)
+    formatted_time = _format_datetime(local_time)
+    day_of_week = _WEEKDAYS[local_time.weekday()]
+    return f"{label}: {formatted_time}\nDay: {day_of_week}\nTimezone: {timezone_name}"
 
-# Shared tool implementation functions
 
 def utc_time_result(server: str = DEFAULT_NTP_SERVER) -> str:
     """
@@ -865,56 +1067,81 @@ def utc_time_result(server: str = DEFAULT_NTP_SERVER) -> str:
     :return: Formatted UTC time string.
     """
     utc_time, is_ntp = get_ntp_datetime(server)
-    formatted_time = utc_time.strftime("%Y-%m-%d %H:%M:%S")
-    day_of_week = utc_time.strftime("%A")
+    return _format_utc_time_result(server, utc_time, is_ntp)
+
+
+async def utc_time_result_async(server: str = DEFAULT_NTP_SERVER) -> str:
+    """
+    Generate the result string for get_utc tool without blocking the event loop.
+
+    :param server: NTP server address to query.
+    :return: Formatted UTC time string.
+    """
+    utc_time, is_ntp = await get_ntp_datetime_async(server)
+    return _format_utc_time_result(server, utc_time, is_ntp)
+
+
+def _format_utc_time_result(server: str, utc_time: datetime, is_ntp: bool) -> str:
+    """
+    Format the get_utc result for an already fetched time.
+
+    :param server: NTP server address that was queried.
+    :param utc_time: Current UTC time.
+    :param is_ntp: Whether utc_time came from the NTP server.
+    :return: Formatted UTC time string.
+    """
+    formatted_time = _format_datetime(utc_time)
+    day_of_week = _WEEKDAYS[utc_time.weekday()]
     fallback_notice = "" if is_ntp else "\n(Note: NTP unavailable, using local server time)"
     return f"Current UTC Time from {server}: {formatted_time}\nDay: {day_of_week}{fallback_notice}"
 
 
-def _format_utc_offset(dt: datetime) -> str:
+# Formatted offset for UTC and zones currently at UTC+0
+_ZERO_OFFSET = "+00:00"
+
+
+def _format_utc_offset(offset: Optional[timedelta]) -> str:
     """
-    Format the UTC offset of a datetime as +HH:MM or -HH:MM.
+    Format a UTC offset as +HH:MM or -HH:MM.
 
-    :param dt: Timezone-aware datetime object.
+    :param offset: Offset from UTC as returned by datetime.utcoffset().
     :return: Formatted offset string (e.g., "+01:00", "-05:00").
     """
-    offset = dt.utcoffset()
     if offset is None:
-        return "+00:00"
+        return _ZERO_OFFSET
 
     total_seconds = int(offset.total_seconds())
+    if total_seconds == 0:
+        return _ZERO_OFFSET
     sign = "+" if total_seconds >= 0 else "-"
     total_seconds = abs(total_seconds)
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes = remainder // 60
     return f"{sign}{hours:02d}:{minutes:02d}"
 
 
-def _get_timezone_abbrev(dt: datetime) -> str:
+def _tz_summary(dt: datetime) -> tuple[str, str, Optional[bool]]:
     """
-    Get the timezone abbreviation (e.g., CET, EST, JST) for a datetime.
+    Describe the timezone of a datetime in one pass over its tzinfo.
 
     :param dt: Timezone-aware datetime object.
-    :return: Timezone abbreviation or empty string if not available.
+    :return: Tuple of (UTC offset string, timezone abbreviation or empty
+             string, DST active flag or None if unknown).
     """
-    abbrev = dt.strftime("%Z")
-    # Filter out numeric-only abbreviations (some systems return offset as abbrev)
-    if abbrev and not abbrev.lstrip("+-").isdigit():
-        return abbrev
-    return ""
+    offset_str = _format_utc_offset(dt.utcoffset())
 
+    # tzname() is what strftime("%Z") reports, without the libc round trip
+    abbrev = dt.tzname() or ""
+    # Filter out numeric abbreviations (tzdata uses e.g. "+03" for zones
+    # without a letter abbreviation). Real abbreviations such as CET, EST or
+    # JST always start with a letter, so checking the first character suffices.
+    if abbrev and abbrev[0] in "+-0123456789":
+        abbrev = ""
 
-def _is_dst_active(dt: datetime) -> Optional[bool]:
-    """
-    Check if DST is active for a given datetime.
-
-    :param dt: Timezone-aware datetime object.
-    :return: True if DST active, False if not, None if unknown.
-    """
     dst = dt.dst()
-    if dst is None:
-        return None
-    return dst.total_seconds() > 0
+    dst_active = None if dst is None else dst.total_seconds() > 0
+
+    return offset_str, abbrev, dst_active
 
 
 def _extract_country_code_from_location(
@@ -943,6 +1170,33 @@ def _extract_country_code_from_location(
     return None
 
 
+@lru_cache(maxsize=CALENDAR_PARSE_CACHE_SIZE)
+def _parse_calendar_param(calendar: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Split a calendar parameter into known and unknown calendar names (cached).
+
+    The parameter is usually one of a handful of literal values, so the
+    lowercasing, splitting and stripping is done once per distinct string.
+
+    :param calendar: Comma-separated list of calendar formats.
+    :return: Tuple of (known names, unknown names), each in requested order,
+             normalized to lowercase with empty entries dropped.
+    """
+    from .core_calendars import CALENDAR_FORMATTERS
+
+    known = []
+    unknown = []
+    for cal_name in calendar.lower().split(","):
+        cal_name = cal_name.strip()
+        if not cal_name:
+            continue
+        if cal_name in ("unix", "isodate") or cal_name in CALENDAR_FORMATTERS:
+            known.append(cal_name)
+        else:
+            unknown.append(cal_name)
+    return tuple(known), tuple(unknown)
+
+
 def current_time_result(
     calendar: str = "",
     tz: str = "",
@@ -958,16 +1212,21 @@ def current_time_result(
     :param city: City name for timezone lookup (primary use case).
     :return: Formatted time string with optional location and calendar conversions.
     """
-    # Get accurate UTC time from NTP
-    utc_time, is_ntp = get_ntp_datetime()
-
-    # Try to resolve location to timezone
-    tz_obj, location_name, location_warning = resolve_location(tz, country, city)
-
     # Determine which time to use for display and calendars
     # If location specified, use local time; otherwise use UTC
     has_location = bool(tz.strip() or country.strip() or city.strip())
 
+    if has_location:
+        # NTP and geocoding are independent network calls, so query NTP in
+        # the background while the location is resolved in this thread
+        ntp_future = _io_pool.submit(get_ntp_datetime)
+        tz_obj, location_name, location_warning = resolve_location(tz, country, city)
+        utc_time, is_ntp = ntp_future.result()
+    else:
+        # Get accurate UTC time from NTP
+        utc_time, is_ntp = get_ntp_datetime()
+        tz_obj, location_name, location_warning = None, "", None
+
     if tz_obj:
         # Successfully resolved timezone - convert to local time
         local_time = utc_time.astimezone(tz_obj)
@@ -977,14 +1236,19 @@ def current_time_result(
         display_time = utc_time
 
     # Format times
-    formatted_display_time = display_time.strftime("%Y-%m-%d %H:%M:%S")
-    formatted_utc_time = utc_time.strftime("%Y-%m-%d %H:%M:%S")
-    day_of_week = display_time.strftime("%A")
-    gregorian_date = display_time.strftime("%Y-%m-%d")
+    formatted_display_time = _format_datetime(display_time)
+    if display_time is utc_time:
+        formatted_utc_time = formatted_display_time
+    else:
+        formatted_utc_time = _format_datetime(utc_time)
+    day_of_week = _WEEKDAYS[display_time.weekday()]
+    # The date is the leading "YYYY-MM-DD" of the formatted display time
+    gregorian_date = formatted_display_time[:10]
 
     # Build result based on whether location was requested
     result_lines = []
     warnings = []
+    calendar_warnings = []
     calendar_sections = []
 
     if has_location:
@@ -994,8 +1258,9 @@ def current_time_result(
             result_lines.append(f"Day: {day_of_week}")
             result_lines.append(f"Location: {location_name}")
 
+            offset_str, tz_abbrev, dst_active = _tz_summary(display_time)
+
             # Build timezone info line with abbreviation if available
-            tz_abbrev = _get_timezone_abbrev(display_time)
             if tz_abbrev:
                 # For IANA timezones, show name and abbreviation
                 if isinstance(tz_obj, ZoneInfo):
@@ -1010,20 +1275,17 @@ def current_time_result(
                     result_lines.append(f"Timezone: {location_name}")
 
             # UTC offset
-            offset_str = _format_utc_offset(display_time)
             result_lines.append(f"UTC Offset: {offset_str}")
 
             # DST status (only for IANA timezones, not fixed offsets)
-            if isinstance(tz_obj, ZoneInfo):
-                dst_active = _is_dst_active(display_time)
-                if dst_active is not None:
-                    dst_text = "Yes" if dst_active else "No"
-                    result_lines.append(f"DST Active: {dst_text}")
+            if isinstance(tz_obj, ZoneInfo) and dst_active is not None:
+                dst_text = "Yes" if dst_active else "No"
+                result_lines.append(f"DST Active: {dst_text}")
 
             # Check if today is a public holiday
             country_code = _extract_country_code_from_location(country, location_name)
             if country_code:
-                today_str = display_time.strftime("%Y-%m-%d")
+                today_str = gregorian_date
                 year = display_time.year
                 holidays = fetch_public_holidays_nager(country_code, year)
                 if not holidays and country_code in OPENHOLIDAYS_SUPPORTED_COUNTRIES:
@@ -1057,47 +1319,60 @@ def current_time_result(
 
     # Process requested calendars if any
     # Calendars use display_time (local if available, UTC otherwise)
-    if calendar.strip():
+    if calendar and not calendar.isspace():
+        from .core_calendars import CALENDAR_FORMATTERS
+
         # Add the Gregorian date line when calendars are requested
         result_lines.append(f"Date: {gregorian_date} (Gregorian)")
 
-        requested = [c.strip().lower() for c in calendar.split(",")]
-        for cal_name in requested:
-            if not cal_name:
-                continue
-            if cal_name in CALENDAR_FORMATTERS:
-                calendar_sections.append(CALENDAR_FORMATTERS[cal_name](display_time))
+        known_calendars, unknown_calendars = _parse_calendar_param(calendar)
+
+        for cal_name in known_calendars:
+            # The two trivial formats are built here without a function call
+            if cal_name == "unix":
+                calendar_sections.append(
+                    f"--- Unix Timestamp ---\n{int(display_time.timestamp())}"
+                )
+            elif cal_name == "isodate":
+                iso_year, iso_week, iso_weekday = display_time.isocalendar()
+                calendar_sections.append(
+                    f"--- ISO Week Date ---\n{iso_year:04d}-W{iso_week:02d}-{iso_weekday}"
+                )
             else:
-                warnings.append(f"(Note: Unknown calendar format ignored: {cal_name})")
+                calendar_sections.append(CALENDAR_FORMATTERS[cal_name](display_time))
 
-    # Build final result
-    # Start with any warnings (for failed location resolution)
-    result_parts = []
+        for cal_name in unknown_calendars:
+            calendar_warnings.append(
+                f"(Note: Unknown calendar format ignored: {cal_name})"
+            )
 
-    if warnings and has_location and not tz_obj:
-        # Put warnings at the top for failed location resolution
-        result_parts.append("\n".join(warnings))
-        result_parts.append("")  # Blank line
+    # Build final result as one flat list of lines, joined once at the end.
+    # The header lines are appended to in place unless warnings go first.
+    output_lines = result_lines
 
-    result_parts.append("\n".join(result_lines))
+    if (warnings or calendar_warnings) and has_location and not tz_obj:
+        # Put warnings at the top for failed location resolution
+        output_lines = [*warnings, *calendar_warnings, "", *result_lines]
 
-    if calendar_sections:
-        result_parts.append("\n" + "\n\n".join(calendar_sections))
+    for section in calendar_sections:
+        output_lines.append("")
+        output_lines.append(section)
 
     # Add calendar warnings (unknown formats) at the end
-    calendar_warnings = [w for w in warnings if "Unknown calendar" in w]
     if calendar_warnings:
-        result_parts.append("\n" + "\n".join(calendar_warnings))
+        output_lines.append("")
+        output_lines.extend(calendar_warnings)
 
     # Add UTC reference time at the end when showing local time
     if has_location and tz_obj:
-        result_parts.append(f"\nUTC Time: {formatted_utc_time}")
+        output_lines.append("")
+        output_lines.append(f"UTC Time: {formatted_utc_time}")
 
     # Add fallback notice if NTP was unavailable
     if not is_ntp:
-        result_parts.append("(Note: NTP unavailable, using local server time)")
+        output_lines.append("(Note: NTP unavailable, using local server time)")
 
-    return "\n".join(result_parts)
+    return "\n".join(output_lines)
 
 
 # Time distance calculation functions
@@ -1430,14 +1705,14 @@ def time_distance_result(
         # Standard output sections (same as non-business mode)
         result_lines.append(f"Direction: {direction}")
         result_lines.append("")
-        result_lines.append(f"From: {from_dt.strftime('%Y-%m-%d %H:%M:%S')}")
-        result_lines.append(f"To: {to_dt.strftime('%Y-%m-%d %H:%M:%S')}")
+        result_lines.append(f"From: {_format_datetime(from_dt)}")
+        result_lines.append(f"To: {_format_datetime(to_dt)}")
         if location_name:
             result_lines.append(f"Location: {location_name}")
         result_lines.append("")
         result_lines.append("UTC Reference:")
-        from_utc = from_dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        to_utc = to_dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        from_utc = _format_datetime(from_dt.astimezone(timezone.utc))
+        to_utc = _format_datetime(to_dt.astimezone(timezone.utc))
         result_lines.append(f"  From: {from_utc} UTC")
         result_lines.append(f"  To: {to_utc} UTC")
     else:
@@ -1460,8 +1735,8 @@ def time_distance_result(
         result_lines.append("")
 
         # Format the from/to dates for display
-        from_display = from_dt.strftime("%Y-%m-%d %H:%M:%S")
-        to_display = to_dt.strftime("%Y-%m-%d %H:%M:%S")
+        from_display = _format_datetime(from_dt)
+        to_display = _format_datetime(to_dt)
 
         result_lines.append(f"From: {from_display}")
         result_lines.append(f"To: {to_display}")
@@ -1473,8 +1748,8 @@ def time_distance_result(
         # Add UTC reference
         result_lines.append("")
         result_lines.append("UTC Reference:")
-        from_utc = from_dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        to_utc = to_dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        from_utc = _format_datetime(from_dt.astimezone(timezone.utc))
+        to_utc = _format_datetime(to_dt.astimezone(timezone.utc))
         result_lines.append(f"  From: {from_utc} UTC")
         result_lines.append(f"  To: {to_utc} UTC")
 
@@ -0,0 +1,129 @@
+"""
+Calendar formatting functions for the MCP timeserver.
+
+Kept separate from core so that the calendar code is only imported when a
+calendar conversion is actually requested. The calendar libraries (hijridate,
+japanera, pyluach, persiantools) are in turn imported inside the functions
+that use them, so requesting one calendar does not load the others.
+"""
+from datetime import datetime
+from functools import lru_cache
+
+# Number of distinct dates (or minutes, for the Japanese calendar) whose
+# formatted output is kept per calendar. The conversions only depend on the
+# date, so repeated requests on the same day reuse the cached string.
+CALENDAR_CACHE_SIZE = 32
+
+
+def calendar_hijri(ntp_time: datetime) -> str:
+    """Format time in Hijri (Islamic) calendar."""
+    return _calendar_hijri(datetime(ntp_time.year, ntp_time.month, ntp_time.day))
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _calendar_hijri(ntp_time: datetime) -> str:
+    """Cached body of calendar_hijri, keyed by the naive local date."""
+    from hijridate import Gregorian
+
+    hijri = Gregorian(ntp_time.year, ntp_time.month, ntp_time.day).to_hijri()
+    hijri_formatted = hijri.isoformat()
+    month_name = hijri.month_name()
+    day_name = hijri.day_name()
+    notation = hijri.notation()
+    return (
+        f"--- Hijri Calendar ---\n"
+        f"Date: {hijri_formatted} {notation}\n"
+        f"Month: {month_name}\n"
+        f"Day: {day_name}"
+    )
+
+
+def calendar_japanese(ntp_time: datetime) -> str:
+    """Format time in Japanese Era calendar (both English and Kanji)."""
+    # Output includes hours and minutes, so cache per minute
+    return _calendar_japanese(datetime(
+        ntp_time.year, ntp_time.month, ntp_time.day,
+        ntp_time.hour, ntp_time.minute
+    ))
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _calendar_japanese(ntp_time: datetime) -> str:
+    """Cached body of calendar_japanese, keyed by the naive local minute."""
+    from japanera import EraDateTime
+
+    era_datetime = EraDateTime.from_datetime(ntp_time)
+    # English format: Reiwa 7, January 15, 14:00
+    english_formatted = era_datetime.strftime("%-E %-Y, %B %d, %H:%M")
+    # Kanji format: 令和7年01月15日 14時
+    kanji_formatted = era_datetime.strftime("%-K%-y年%m月%d日 %H時")
+    era_english = era_datetime.era.english
+    era_kanji = era_datetime.era.kanji
+    return (
+        f"--- Japanese Calendar ---\n"
+        f"English: {english_formatted}\n"
+        f"Kanji: {kanji_formatted}\n"
+        f"Era: {era_english} ({era_kanji})"
+    )
+
+
+def calendar_persian(ntp_time: datetime) -> str:
+    """Format time in Persian (Jalali) calendar (both English and Farsi)."""
+    return _calendar_persian(datetime(ntp_time.year, ntp_time.month, ntp_time.day))
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _calendar_persian(ntp_time: datetime) -> str:
+    """Cached body of calendar_persian, keyed by the naive local date."""
+    from persiantools.jdatetime import JalaliDateTime
+
+    jalali_dt = JalaliDateTime(ntp_time)
+    english_formatted = jalali_dt.strftime("%A %d %B %Y", locale="en")
+    farsi_formatted = jalali_dt.strftime("%A %d %B %Y", locale="fa")
+    return (
+        f"--- Persian Calendar ---\n"
+        f"English: {english_formatted}\n"
+        f"Farsi: {farsi_formatted}"
+    )
+
+
+def calendar_hebrew(ntp_time: datetime) -> str:
+    """Format time in Hebrew (Jewish) calendar (both English and Hebrew)."""
+    return _calendar_hebrew(datetime(ntp_time.year, ntp_time.month, ntp_time.day))
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _calendar_hebrew(ntp_time: datetime) -> str:
+    """Cached body of calendar_hebrew, keyed by the naive local date."""
+    from pyluach import dates as hebrew_dates
+
+    gregorian_date = hebrew_dates.GregorianDate(
+        ntp_time.year, ntp_time.month, ntp_time.day
+    )
+    hebrew_date = gregorian_date.to_heb()
+    english_formatted = f"{hebrew_date.day} {hebrew_date.month_name()} {hebrew_date.year}"
+    hebrew_formatted = hebrew_date.hebrew_date_string()
+
+    # Check for holiday in both languages
+    holiday_en = hebrew_date.holiday(hebrew=False)
+    holiday_he = hebrew_date.holiday(hebrew=True)
+    holiday_line = ""
+    if holiday_en:
+        holiday_line = f"\nHoliday: {holiday_en} ({holiday_he})"
+
+    return (
+        f"--- Hebrew Calendar ---\n"
+        f"English: {english_formatted}\n"
+        f"Hebrew: {hebrew_formatted}"
+        f"{holiday_line}"
+    )
+
+
+# Mapping of calendar names to their formatting functions. The "unix" and
+# "isodate" formats are one-liners built inline in core.current_time_result.
+CALENDAR_FORMATTERS = {
+    "hijri": calendar_hijri,
+    "japanese": calendar_japanese,
+    "persian": calendar_persian,
+    "hebrew": calendar_hebrew,
+}
@@ -4,13 +4,13 @@ MCP Simple Timeserver - Local (stdio) variant.
 This server provides time-related tools to AI assistants via the
 Model Context Protocol (MCP) using stdio transport.
 """
-from datetime import datetime
-from importlib.metadata import version
 
 from fastmcp import FastMCP
 
 from .core import (
     DEFAULT_NTP_SERVER,
+    get_package_version,
+    local_time_result,
     utc_time_result,
     current_time_result,
     time_distance_result,
@@ -19,8 +19,8 @@ from .core import (
 )
 
 
-# Get package version dynamically from pyproject.toml via importlib.metadata
-_version = version("mcp-simple-timeserver")
+# Package version from pyproject.toml, looked up once and shared with core
+_version = get_package_version()
 
 app = FastMCP("mcp-simple-timeserver", version=_version)
 
@@ -39,11 +39,7 @@ def get_local_time() -> str:
     Returns the current local time and timezone information from your local machine.
     This helps you understand what time it is for the user you're assisting.
     """
-    local_time = datetime.now()
-    timezone = str(local_time.astimezone().tzinfo)
-    formatted_time = local_time.strftime("%Y-%m-%d %H:%M:%S")
-    day_of_week = local_time.strftime("%A")
-    return f"Current Time: {formatted_time}\nDay: {day_of_week}\nTimezone: {timezone}"
+    return local_time_result("Current Time")
 
 
 @app.tool(
@@ -5,23 +5,25 @@ This server provides time-related tools to AI assistants via the
 Model Context Protocol (MCP) using streamable HTTP transport.
 Designed for network deployment behind a reverse proxy.
 """
-from datetime import datetime
-from importlib.metadata import version
+import asyncio
 
 from fastmcp import FastMCP
 
 from ..core import (
     DEFAULT_NTP_SERVER,
-    utc_time_result,
+    get_package_version,
+    local_time_result,
+    utc_time_result_async,
     current_time_result,
     time_distance_result,
     get_holidays_result,
     is_holiday_result,
+    warmup,
 )
 
 
-# Get package version dynamically from pyproject.toml via importlib.metadata
-_version = version("mcp-simple-timeserver")
+# Package version from pyproject.toml, looked up once and shared with core
+_version = get_package_version()
 
 # Create the FastMCP app with web-specific settings
 # Note: host and port moved to run() per FastMCP 2.x deprecation.
@@ -44,11 +46,7 @@ def get_server_time() -> str:
     Returns the current local time and timezone from the server hosting this tool.
     Note: This is the server's time, which may be different from the user's local time.
     """
-    local_time = datetime.now()
-    timezone = str(local_time.astimezone().tzinfo)
-    formatted_time = local_time.strftime("%Y-%m-%d %H:%M:%S")
-    day_of_week = local_time.strftime("%A")
-    return f"Current Server Time: {formatted_time}\nDay: {day_of_week}\nTimezone: {timezone}"
+    return local_time_result("Current Server Time")
 
 
 @app.tool(
@@ -57,14 +55,14 @@ def get_server_time() -> str:
         "readOnlyHint": True
     }
 )
-def get_utc(server: str = DEFAULT_NTP_SERVER) -> str:
+async def get_utc(server: str = DEFAULT_NTP_SERVER) -> str:
     """
     Returns accurate UTC time from an NTP server.
     This provides a universal time reference regardless of local timezone.
 
     :param server: NTP server address (default: pool.ntp.org)
     """
-    return utc_time_result(server)
+    return await utc_time_result_async(server)
 
 
 @app.tool(
@@ -73,7 +71,7 @@ def get_utc(server: str = DEFAULT_NTP_SERVER) -> str:
         "readOnlyHint": True
     }
 )
-def get_current_time(
+async def get_current_time(
     calendar: str = "",
     timezone: str = "",
     country: str = "",
@@ -125,7 +123,10 @@ def get_current_time(
     Uses accurate time from NTP server when available.
     Invalid locations fall back to UTC with a helpful message.
     """
-    return current_time_result(calendar, timezone, country, city)
+    # NTP and geocoding block on the network, so keep them off the event loop
+    return await asyncio.to_thread(
+        current_time_result, calendar, timezone, country, city
+    )
 
 
 @app.tool(
@@ -134,7 +135,7 @@ def get_current_time(
         "readOnlyHint": True
     }
 )
-def calculate_time_distance(
+async def calculate_time_distance(
     from_date: str = "now",
     to_date: str = "now",
     unit: str = "auto",
@@ -201,7 +202,8 @@ def calculate_time_distance(
     NOTE: If both parameters are the same (e.g., both "now"), returns an error message.
     Uses accurate NTP time when "now" is specified.
     """
-    return time_distance_result(
+    return await asyncio.to_thread(
+        time_distance_result,
         from_date,
         to_date,
         unit,
@@ -308,8 +310,24 @@ def is_holiday(
 
 
 if __name__ == "__main__":
+    # Load timezone data before accepting requests, so the first location
+    # query from a user does not pay for it
+    warmup()
+
     # Run the server with streamable-http transport
     # Host 0.0.0.0 to listen on all interfaces inside the container
-    app.run(transport="streamable-http", host="0.0.0.0", 
+    run_kwargs = dict(
+        transport="streamable-http",
+        host="0.0.0.0",
         stateless_http=False,
-        port=8000)
+        port=8000,
+    )
+
+    # Use the faster libuv-based event loop when the optional 'web' extra
+    # (uvloop) is installed; fall back to the standard asyncio loop otherwise
+    try:
+        import uvloop
+    except ImportError:
+        app.run(**run_kwargs)
+    else:
+        uvloop.run(app.run_async(**run_kwargs))
@@ -4,65 +4,182 @@ Test script for mcp-simple-timeserver
 Tests all available tools via JSON-RPC over stdio
 """
 
+from functools import lru_cache
 import json
+import os
 import subprocess
 import sys
+import tempfile
 
+# Server stderr goes here for inspecting failures
+SERVER_LOG_PATH = os.path.join(tempfile.gettempdir(), "mcp-simple-timeserver-test.log")
 
-def call_server(requests: list[dict], expected_responses: int = 2) -> list[dict]:
+# Time allowed for one response before the server is considered hung. A single
+# tool call can chain several network requests with 5 s timeouts each (e.g.
+# is_holiday with a city: geocoding, NTP and up to four holiday API requests).
+CALL_TIMEOUT = 60  # seconds
+
+# Bound once so the hot read/write loops skip the json module lookups
+_LOADS = json.JSONDecoder().decode
+_DUMPS = json.dumps
+
+
+class ServerSession:
     """
-    Send JSON-RPC requests to the MCP server and return responses.
-    Reads responses line by line and waits for expected number.
+    A single long-lived MCP server subprocess shared by all tests.
+    The server is started and the MCP handshake is done once, in __enter__;
+    requests are then sent over the same stdin/stdout pipes. If the server
+    dies (e.g. killed by the watchdog after a hung call), it is restarted
+    before the next request. If it does not answer the handshake, later
+    requests fail straight away instead of each waiting for a timeout.
     """
-    import os
-    import select
-
-    # Build the input as newline-delimited JSON
-    input_data = "\n".join(json.dumps(req) for req in requests) + "\n"
-
-    # Set environment to ensure unbuffered output
-    env = os.environ.copy()
-    env["PYTHONUNBUFFERED"] = "1"
-
-    # Run the server
-    process = subprocess.Popen(
-        [sys.executable, "-u", "-m", "mcp_simple_timeserver"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-        text=True,
-        env=env
-    )
-
-    # Write all input
-    process.stdin.write(input_data)
-    process.stdin.flush()
-
-    # Read responses until we have enough or timeout
-    responses = []
-    import time
-    start_time = time.time()
-    timeout = 10  # seconds
-
-    while len(responses) < expected_responses and (time.time() - start_time) < timeout:
-        # Check if there's data to read (with a short timeout)
-        if select.select([process.stdout], [], [], 0.1)[0]:
-            line = process.stdout.readline()
-            if not line:
-                break  # EOF
-            line = line.strip()
-            if line and line.startswith("{"):
-                try:
-                    responses.append(json.loads(line))
-                except json.JSONDecodeError:
-                    pass
-
-    # Clean up
-    process.stdin.close()
-    process.terminate()
-    process.wait(timeout=2)
-
-    return responses
+
+    def __init__(self, timeout: float = CALL_TIMEOUT):
+        self.timeout = timeout
+        self.process = None
+        self.server_info = {}
+        # Responses read while waiting for a different request ID
+        self._pending = {}
+        # Set when the server did not answer the handshake
+        self._broken = False
+
+    def __enter__(self) -> "ServerSession":
+        # Keep the server's stderr for inspecting failures
+        self._log = open(SERVER_LOG_PATH, "wb")
+        self._start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop()
+        self._log.close()
+
+    def _start(self) -> None:
+        """Start the server process and do the MCP handshake."""
+        # Set environment to ensure unbuffered output
+        env = os.environ.copy()
+        env["PYTHONUNBUFFERED"] = "1"
+
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", "-m", "mcp_simple_timeserver"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._log,
+            # Large pipe buffers so each read picks up many responses at once
+            bufsize=65536,
+            # Only the three standard streams matter; skip closing every other fd
+            close_fds=False,
+            env=env
+        )
+
+        self._pending = {}
+        self._write(_HANDSHAKE_BYTES)
+        response = self._read_response(_INITIALIZE_ID)
+        self._broken = response is None
+        if response and "result" in response:
+            self.server_info = response["result"].get("serverInfo", {})
+
+    def _stop(self) -> None:
+        """Stop the server process."""
+        self.process.stdin.close()
+        self.process.terminate()
+        self.process.wait(timeout=2)
+
+    def _ensure_running(self) -> bool:
+        """
+        Restart the server if it has exited since the last request.
+        Returns False if there is no working server to send requests to.
+        """
+        if self._broken:
+            return False
+        if self.process.poll() is None:
+            return True
+        print("  WARNING: Server exited, restarting it")
+        self._stop()
+        self._start()
+        if self._broken:
+            print("  ERROR: Server did not restart, failing the remaining calls")
+        return not self._broken
+
+    def _send(self, requests: list[dict]) -> bool:
+        """
+        Write requests to the server as newline-delimited JSON.
+        Returns False if the server is gone.
+        """
+        # Stage all frames in one bytes buffer so they go out in a single write
+        buf = bytearray()
+        for req in requests:
+            buf += _DUMPS(req).encode()
+            buf += b"\n"
+        return self._write(bytes(buf))
+
+    def _write(self, input_data: bytes) -> bool:
+        """
+        Write already serialized requests to the server.
+        Returns False if the server is gone.
+        """
+        # Straight to the pipe, bypassing the buffered writer; loop on short writes
+        fd = self.process.stdin.fileno()
+        view = memoryview(input_data)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        except OSError:
+            # BrokenPipeError once the server has exited (SIGPIPE is ignored)
+            return False
+        return True
+
+    def _read_response(self, request_id: int) -> dict | None:
+        """
+        Read responses until the one with the given request ID arrives.
+        Returns None on timeout or if the server exits.
+        """
+        import threading
+
+        if request_id in self._pending:
+            return self._pending.pop(request_id)
+
+        # Blocking reads; a watchdog kills a hung server so readline() hits EOF
+        watchdog = threading.Timer(self.timeout, self.process.kill)
+        watchdog.start()
+        try:
+            for line in self.process.stdout:
+                line = line.strip()
+                if line and line.startswith(b"{"):
+                    try:
+                        response = _LOADS(line.decode())
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        continue
+                    response_id = response.get("id")
+                    if response_id == request_id:
+                        return response
+                    if response_id is not None:
+                        self._pending[response_id] = response
+        finally:
+            watchdog.cancel()
+
+        # EOF: the server closed stdout or the watchdog killed it. Make sure it
+        # is gone, so the next request starts a fresh one.
+        self.process.kill()
+        self.process.wait()
+        return None
+
+    def call(self, method: str, params: dict | None, request_id: int) -> dict | None:
+        """Send one JSON-RPC request and return its response, or None if failed."""
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            request["params"] = params
+        if not self._ensure_running() or not self._send([request]):
+            return None
+        return self._read_response(request_id)
+
+    def call_serialized(self, request: bytes, request_id: int) -> dict | None:
+        """
+        Send one already serialized request and return its response, or None
+        if failed.
+        """
+        if not self._ensure_running() or not self._write(request):
+            return None
+        return self._read_response(request_id)
 
 
 def handshake() -> list[dict]:
@@ -86,86 +203,153 @@ def handshake() -> list[dict]:
     ]
 
 
-def call_tool(tool_name: str, arguments: dict, request_id: int) -> str | None:
-    """
-    Call a tool and return its text result, or None if failed.
-    """
-    requests = handshake() + [
-        {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
-    ]
+# The handshake never changes, so it is serialized once at import
+_INITIALIZE_ID = handshake()[0]["id"]
+_HANDSHAKE_BYTES = b"".join(_DUMPS(req).encode() + b"\n" for req in handshake())
 
-    responses = call_server(requests)
 
-    # Find the response with our request ID
-    for response in responses:
-        if response.get("id") == request_id and "result" in response:
-            content = response["result"].get("content", [])
-            if content and "text" in content[0]:
-                return content[0]["text"]
+def tool_call_request(tool_name: str, arguments: dict, request_id: int) -> dict:
+    """Build a tools/call JSON-RPC request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {
+            "name": tool_name,
+            "arguments": arguments
+        }
+    }
+
+
+# Define tests: (tool_name, arguments, description, request_id)
+TESTS = [
+    # Basic tools
+    ("get_local_time", {}, "Get local time and timezone", 10),
+    ("get_utc", {}, "Get UTC time from NTP server", 20),
+
+    # get_current_time with various calendar options
+    ("get_current_time", {}, "Get current time (default, no calendars)", 30),
+    ("get_current_time", {"calendar": "unix"}, "Get current time with Unix timestamp", 40),
+    ("get_current_time", {"calendar": "isodate"}, "Get current time with ISO week date", 50),
+    ("get_current_time", {"calendar": "hijri"}, "Get current time with Hijri calendar", 60),
+    ("get_current_time", {"calendar": "japanese"}, "Get current time with Japanese calendar", 70),
+    ("get_current_time", {"calendar": "hebrew"}, "Get current time with Hebrew calendar", 80),
+    ("get_current_time", {"calendar": "persian"}, "Get current time with Persian calendar", 90),
+    ("get_current_time", {"calendar": "unix,hijri,japanese"}, "Get current time with multiple calendars", 100),
+    ("get_current_time", {"calendar": "unix,invalid,hebrew"}, "Get current time with invalid calendar (graceful)", 110),
+
+    # get_current_time with location parameters
+    ("get_current_time", {"city": "Warsaw"}, "Get time in Warsaw (city lookup)", 120),
+    ("get_current_time", {"city": "Tokyo"}, "Get time in Tokyo (city lookup)", 130),
+    ("get_current_time", {"country": "Poland"}, "Get time in Poland (country lookup)", 140),
+    ("get_current_time", {"timezone": "America/New_York"}, "Get time with IANA timezone", 150),
+    ("get_current_time", {"timezone": "+05:30"}, "Get time with UTC offset (+05:30)", 160),
+    ("get_current_time", {"city": "Gotham"}, "Get time in invalid city (graceful fallback)", 170),
+    ("get_current_time", {"city": "Tokyo", "calendar": "japanese"}, "Get Tokyo time with Japanese calendar", 180),
+    ("get_current_time", {"timezone": "InvalidTZ"}, "Get time with invalid timezone (graceful fallback)", 190),
+
+    # calculate_time_distance tests
+    ("calculate_time_distance", {}, "Same params error (both default to now)", 200),
+    ("calculate_time_distance", {"from_date": "2025-01-01", "to_date": "2025-01-01"}, "Same params error (explicit)", 205),
+    ("calculate_time_distance", {"from_date": "2025-01-01", "to_date": "2025-01-15"}, "Basic date distance", 210),
+    ("calculate_time_distance", {"from_date": "now", "to_date": "2025-12-31"}, "Countdown to date", 220),
+    ("calculate_time_distance", {"from_date": "2025-01-01", "to_date": "2025-01-15", "unit": "weeks"}, "Distance in weeks", 230),
+    ("calculate_time_distance", {"from_date": "2025-01-15", "to_date": "2025-01-01"}, "Past direction", 240),
+    ("calculate_time_distance", {"from_date": "2025-01-01T09:00:00", "to_date": "2025-01-01T17:30:00"}, "Same day with time", 250),
+    ("calculate_time_distance", {"from_date": "now", "to_date": "2025-06-01", "city": "Warsaw"}, "With location", 260),
+
+    # Business days tests (inclusive, date-based)
+    ("calculate_time_distance", {"from_date": "2026-01-05", "to_date": "2026-01-09", "business_days": True}, "Mon-Fri = 5 business days", 265),
+    ("calculate_time_distance", {"from_date": "2026-01-03", "to_date": "2026-01-04", "business_days": True}, "Sat-Sun = 0 business days", 266),
+
+    # Same-day edge cases
+    ("calculate_time_distance", {"from_date": "2026-01-05", "to_date": "2026-01-05", "business_days": True}, "Same day (Monday) = 1 business day", 267),
+    ("calculate_time_distance", {"from_date": "2026-01-04", "to_date": "2026-01-04", "business_days": True}, "Same day (Sunday) = 0 business days", 268),
+
+    ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-10", "business_days": True, "exclude_holidays": True, "country": "Poland"}, "With holidays (excludes Jan 1 New Year, Jan 6 Epiphany)", 269),
+    ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-10", "business_days": True, "exclude_holidays": True}, "exclude_holidays without country (should warn)", 270),
+
+    # Global coverage (non-Europe + city-based country extraction)
+    ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-07", "business_days": True, "exclude_holidays": True, "country": "United States"}, "US: New Year's Day (non-Europe)", 271),
+    ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-07", "business_days": True, "exclude_holidays": True, "country": "Japan"}, "Japan: New Year's Day (Asia)", 272),
+    ("calculate_time_distance", {"from_date": "2026-01-26", "to_date": "2026-01-30", "business_days": True, "exclude_holidays": True, "city": "Sydney"}, "Australia: Australia Day (Oceania, city-based)", 273),
+    ("calculate_time_distance", {"from_date": "2026-04-24", "to_date": "2026-04-28", "business_days": True, "exclude_holidays": True, "country": "South Africa"}, "South Africa: Freedom Day (Africa)", 274),
+    ("calculate_time_distance", {"from_date": "2026-04-20", "to_date": "2026-04-24", "business_days": True, "exclude_holidays": True, "city": "Sao Paulo"}, "Brazil: Tiradentes Day (South America, city-based)", 275),
+    ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-07", "business_days": True, "exclude_holidays": True, "city": "Tokyo"}, "City-based country extraction (Tokyo → Japan)", 276),
+
+    # get_holidays tests
+    ("get_holidays", {"country": "Poland"}, "Get holidays for Poland (current year)", 300),
+    ("get_holidays", {"country": "PL", "year": 2026}, "Get holidays with ISO code and year", 310),
+    ("get_holidays", {"country": "Germany", "include_school_holidays": True}, "Get holidays with school holidays", 320),
+    ("get_holidays", {"country": "United States"}, "Get holidays for USA (Nager.Date only)", 330),
+    ("get_holidays", {"country": "InvalidCountry"}, "Get holidays for invalid country (graceful error)", 340),
+
+    # is_holiday tests
+    ("is_holiday", {"country": "Poland", "date": "2026-01-01"}, "Check New Year's Day in Poland", 350),
+    ("is_holiday", {"country": "PL", "date": "2026-01-23"}, "Check non-holiday date in Poland", 360),
+    ("is_holiday", {"country": "US"}, "Check today in USA (default date)", 370),
+    ("is_holiday", {"country": "Germany", "date": "2026-12-25"}, "Check Christmas in Germany", 380),
+    ("is_holiday", {"country": "XYZ", "date": "2026-01-01"}, "Check invalid country (graceful error)", 390),
+
+    # is_holiday with city parameter tests
+    ("is_holiday", {"city": "Warsaw", "date": "2026-01-19"}, "Check school holiday in Warsaw (winter break)", 400),
+    ("is_holiday", {"city": "Krakow", "date": "2026-01-01"}, "Check New Year in Krakow (city lookup)", 410),
+    ("is_holiday", {"city": "Berlin"}, "Check today in Berlin (city default date)", 420),
+    ("is_holiday", {"city": "InvalidCity123"}, "Check invalid city (graceful error)", 430),
+
+    # is_holiday with smaller/less obvious cities (international diversity)
+    ("is_holiday", {"city": "Sieradz", "date": "2026-02-02"}, "Check school holiday in Sieradz, Poland (small city)", 440),
+    ("is_holiday", {"city": "Segovia", "date": "2026-12-25"}, "Check Christmas in Segovia, Spain (small city)", 450),
+    ("is_holiday", {"city": "Temuco", "date": "2026-09-18"}, "Check Independence Day in Temuco, Chile", 460),
+    ("is_holiday", {"city": "Braga", "date": "2026-06-10"}, "Check Portugal Day in Braga, Portugal", 470),
+    ("is_holiday", {"city": "Graz", "date": "2026-05-01"}, "Check Labour Day in Graz, Austria", 480),
+]
+
+# The table is static, so its tools/call requests are serialized once at import
+_TEST_REQUESTS = {
+    request_id: _DUMPS(tool_call_request(tool_name, arguments, request_id)).encode() + b"\n"
+    for tool_name, arguments, _, request_id in TESTS
+}
+
+
+def tool_result_text(response: dict | None) -> str | None:
+    """
+    Return the text result of a tools/call response, or None if failed.
+    """
+    if response and "result" in response:
+        content = response["result"].get("content", [])
+        if content and "text" in content[0]:
+            return content[0]["text"]
 
     return None
 
 
-def list_tools() -> int | None:
+def list_tools(session: ServerSession) -> int | None:
     """List tools and return the count, or None if failed."""
-    requests = handshake() + [
-        {
-            "jsonrpc": "2.0",
-            "id": 100,
-            "method": "tools/list"
-        }
-    ]
-
-    responses = call_server(requests)
+    response = session.call("tools/list", None, 2)
 
-    for response in responses:
-        if response.get("id") == 100 and "result" in response:
-            tools = response["result"].get("tools", [])
-            return len(tools)
+    if response and "result" in response:
+        tools = response["result"].get("tools", [])
+        return len(tools)
 
     return None
 
 
-def check_server_version() -> tuple[str | None, str | None]:
-    """
-    Check server version from initialize response.
-    Returns tuple of (reported_version, expected_version) or (None, expected) if failed.
-    """
+@lru_cache(maxsize=1)
+def expected_version() -> str:
+    """Return the installed package version (read from metadata once)."""
     from importlib.metadata import version as get_version
 
-    expected_version = get_version("mcp-simple-timeserver")
-
-    # Just send initialize request (no notification needed for this check)
-    requests = [
-        {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "clientInfo": {"name": "test-client", "version": "1.0"},
-                "capabilities": {}
-            }
-        }
-    ]
-
-    responses = call_server(requests, expected_responses=1)
+    return get_version("mcp-simple-timeserver")
 
-    for response in responses:
-        if response.get("id") == 1 and "result" in response:
-            server_info = response["result"].get("serverInfo", {})
-            reported_version = server_info.get("version")
-            return (reported_version, expected_version)
 
-    return (None, expected_version)
+def check_server_version(session: ServerSession) -> tuple[str | None, str | None]:
+    """
+    Check server version from initialize response.
+    Returns tuple of (reported_version, expected_version) or (None, expected) if failed.
+    """
+    reported_version = session.server_info.get("version")
+    return (reported_version, expected_version())
 
 
 def main():
@@ -175,10 +359,17 @@ def main():
     print("=" * 50)
     print()
 
+    # One server process serves every test below
+    with ServerSession() as session:
+        return run_tests(session)
+
+
+def run_tests(session: ServerSession) -> int:
+    """Run all tests against a running server session."""
     # Test server version
     print("Testing: server version")
     print("  Checking version reported in initialize response...")
-    reported_ver, expected_ver = check_server_version()
+    reported_ver, expected_ver = check_server_version(session)
     if reported_ver is not None:
         if reported_ver == expected_ver:
             print(f"  Result: Version {reported_ver} (matches pyproject.toml)")
@@ -193,7 +384,7 @@ def main():
     # Test tools/list
     print("Testing: tools/list")
     print("  Listing all available tools...")
-    tool_count = list_tools()
+    tool_count = list_tools(session)
     if tool_count is not None:
         print(f"  Result: Found {tool_count} tools")
         if tool_count != 6:
@@ -202,98 +393,17 @@ def main():
         print("  ERROR: Could not list tools")
     print()
 
-    # Define tests: (tool_name, arguments, description, request_id)
-    tests = [
-        # Basic tools
-        ("get_local_time", {}, "Get local time and timezone", 10),
-        ("get_utc", {}, "Get UTC time from NTP server", 20),
-
-        # get_current_time with various calendar options
-        ("get_current_time", {}, "Get current time (default, no calendars)", 30),
-        ("get_current_time", {"calendar": "unix"}, "Get current time with Unix timestamp", 40),
-        ("get_current_time", {"calendar": "isodate"}, "Get current time with ISO week date", 50),
-        ("get_current_time", {"calendar": "hijri"}, "Get current time with Hijri calendar", 60),
-        ("get_current_time", {"calendar": "japanese"}, "Get current time with Japanese calendar", 70),
-        ("get_current_time", {"calendar": "hebrew"}, "Get current time with Hebrew calendar", 80),
-        ("get_current_time", {"calendar": "persian"}, "Get current time with Persian calendar", 90),
-        ("get_current_time", {"calendar": "unix,hijri,japanese"}, "Get current time with multiple calendars", 100),
-        ("get_current_time", {"calendar": "unix,invalid,hebrew"}, "Get current time with invalid calendar (graceful)", 110),
-
-        # get_current_time with location parameters
-        ("get_current_time", {"city": "Warsaw"}, "Get time in Warsaw (city lookup)", 120),
-        ("get_current_time", {"city": "Tokyo"}, "Get time in Tokyo (city lookup)", 130),
-        ("get_current_time", {"country": "Poland"}, "Get time in Poland (country lookup)", 140),
-        ("get_current_time", {"timezone": "America/New_York"}, "Get time with IANA timezone", 150),
-        ("get_current_time", {"timezone": "+05:30"}, "Get time with UTC offset (+05:30)", 160),
-        ("get_current_time", {"city": "Gotham"}, "Get time in invalid city (graceful fallback)", 170),
-        ("get_current_time", {"city": "Tokyo", "calendar": "japanese"}, "Get Tokyo time with Japanese calendar", 180),
-        ("get_current_time", {"timezone": "InvalidTZ"}, "Get time with invalid timezone (graceful fallback)", 190),
-
-        # calculate_time_distance tests
-        ("calculate_time_distance", {}, "Same params error (both default to now)", 200),
-        ("calculate_time_distance", {"from_date": "2025-01-01", "to_date": "2025-01-01"}, "Same params error (explicit)", 205),
-        ("calculate_time_distance", {"from_date": "2025-01-01", "to_date": "2025-01-15"}, "Basic date distance", 210),
-        ("calculate_time_distance", {"from_date": "now", "to_date": "2025-12-31"}, "Countdown to date", 220),
-        ("calculate_time_distance", {"from_date": "2025-01-01", "to_date": "2025-01-15", "unit": "weeks"}, "Distance in weeks", 230),
-        ("calculate_time_distance", {"from_date": "2025-01-15", "to_date": "2025-01-01"}, "Past direction", 240),
-        ("calculate_time_distance", {"from_date": "2025-01-01T09:00:00", "to_date": "2025-01-01T17:30:00"}, "Same day with time", 250),
-        ("calculate_time_distance", {"from_date": "now", "to_date": "2025-06-01", "city": "Warsaw"}, "With location", 260),
-
-        # Business days tests (inclusive, date-based)
-        ("calculate_time_distance", {"from_date": "2026-01-05", "to_date": "2026-01-09", "business_days": True}, "Mon-Fri = 5 business days", 265),
-        ("calculate_time_distance", {"from_date": "2026-01-03", "to_date": "2026-01-04", "business_days": True}, "Sat-Sun = 0 business days", 266),
-
-        # Same-day edge cases
-        ("calculate_time_distance", {"from_date": "2026-01-05", "to_date": "2026-01-05", "business_days": True}, "Same day (Monday) = 1 business day", 267),
-        ("calculate_time_distance", {"from_date": "2026-01-04", "to_date": "2026-01-04", "business_days": True}, "Same day (Sunday) = 0 business days", 268),
-
-        ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-10", "business_days": True, "exclude_holidays": True, "country": "Poland"}, "With holidays (excludes Jan 1 New Year, Jan 6 Epiphany)", 269),
-        ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-10", "business_days": True, "exclude_holidays": True}, "exclude_holidays without country (should warn)", 270),
-
-        # Global coverage (non-Europe + city-based country extraction)
-        ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-07", "business_days": True, "exclude_holidays": True, "country": "United States"}, "US: New Year's Day (non-Europe)", 271),
-        ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-07", "business_days": True, "exclude_holidays": True, "country": "Japan"}, "Japan: New Year's Day (Asia)", 272),
-        ("calculate_time_distance", {"from_date": "2026-01-26", "to_date": "2026-01-30", "business_days": True, "exclude_holidays": True, "city": "Sydney"}, "Australia: Australia Day (Oceania, city-based)", 273),
-        ("calculate_time_distance", {"from_date": "2026-04-24", "to_date": "2026-04-28", "business_days": True, "exclude_holidays": True, "country": "South Africa"}, "South Africa: Freedom Day (Africa)", 274),
-        ("calculate_time_distance", {"from_date": "2026-04-20", "to_date": "2026-04-24", "business_days": True, "exclude_holidays": True, "city": "Sao Paulo"}, "Brazil: Tiradentes Day (South America, city-based)", 275),
-        ("calculate_time_distance", {"from_date": "2026-01-01", "to_date": "2026-01-07", "business_days": True, "exclude_holidays": True, "city": "Tokyo"}, "City-based country extraction (Tokyo → Japan)", 276),
-
-        # get_holidays tests
-        ("get_holidays", {"country": "Poland"}, "Get holidays for Poland (current year)", 300),
-        ("get_holidays", {"country": "PL", "year": 2026}, "Get holidays with ISO code and year", 310),
-        ("get_holidays", {"country": "Germany", "include_school_holidays": True}, "Get holidays with school holidays", 320),
-        ("get_holidays", {"country": "United States"}, "Get holidays for USA (Nager.Date only)", 330),
-        ("get_holidays", {"country": "InvalidCountry"}, "Get holidays for invalid country (graceful error)", 340),
-
-        # is_holiday tests
-        ("is_holiday", {"country": "Poland", "date": "2026-01-01"}, "Check New Year's Day in Poland", 350),
-        ("is_holiday", {"country": "PL", "date": "2026-01-23"}, "Check non-holiday date in Poland", 360),
-        ("is_holiday", {"country": "US"}, "Check today in USA (default date)", 370),
-        ("is_holiday", {"country": "Germany", "date": "2026-12-25"}, "Check Christmas in Germany", 380),
-        ("is_holiday", {"country": "XYZ", "date": "2026-01-01"}, "Check invalid country (graceful error)", 390),
-
-        # is_holiday with city parameter tests
-        ("is_holiday", {"city": "Warsaw", "date": "2026-01-19"}, "Check school holiday in Warsaw (winter break)", 400),
-        ("is_holiday", {"city": "Krakow", "date": "2026-01-01"}, "Check New Year in Krakow (city lookup)", 410),
-        ("is_holiday", {"city": "Berlin"}, "Check today in Berlin (city default date)", 420),
-        ("is_holiday", {"city": "InvalidCity123"}, "Check invalid city (graceful error)", 430),
-
-        # is_holiday with smaller/less obvious cities (international diversity)
-        ("is_holiday", {"city": "Sieradz", "date": "2026-02-02"}, "Check school holiday in Sieradz, Poland (small city)", 440),
-        ("is_holiday", {"city": "Segovia", "date": "2026-12-25"}, "Check Christmas in Segovia, Spain (small city)", 450),
-        ("is_holiday", {"city": "Temuco", "date": "2026-09-18"}, "Check Independence Day in Temuco, Chile", 460),
-        ("is_holiday", {"city": "Braga", "date": "2026-06-10"}, "Check Portugal Day in Braga, Portugal", 470),
-        ("is_holiday", {"city": "Graz", "date": "2026-05-01"}, "Check Labour Day in Graz, Austria", 480),
-    ]
-
     passed = 0
     failed = 0
 
-    for tool_name, arguments, description, request_id in tests:
+    for tool_name, arguments, description, request_id in TESTS:
         print(f"Testing: {tool_name}")
         print(f"  {description}")
 
-        result = call_tool(tool_name, arguments, request_id)
+        # One call at a time: the geocoding and holiday APIs are rate limited
+        result = tool_result_text(
+            session.call_serialized(_TEST_REQUESTS[request_id], request_id)
+        )
 
         if result is not None:
             print("  Result:")
@@ -307,6 +417,8 @@ def main():
 
     print("=" * 50)
     print(f"  Tests completed: {passed} passed, {failed} failed")
+    if failed:
+        print(f"  Server log: {SERVER_LOG_PATH}")
     print("=" * 50)
 
     return 0 if failed == 0 else 1